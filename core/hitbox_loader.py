@@ -22,6 +22,7 @@ class HitboxLoader:
         """
         self.base_dir = base_dir
         self.hitboxes: Dict[str, List[Dict]] = {}
+        self._boxes: Dict[str, List[Tuple[int, int, int, int, str]]] = {}
         
         print(f"[HitboxLoader] Base dir: {base_dir}")
     
@@ -50,6 +51,7 @@ class HitboxLoader:
                         data = json.load(f)
                     
                     self.hitboxes[filename] = data.get('hitboxes', [])
+                    self._boxes[filename] = self._build_boxes(self.hitboxes[filename])
                     print(f"[HitboxLoader] Loaded {filename}: {len(self.hitboxes[filename])} hitboxes")
                     return True
                 except Exception as e:
@@ -60,6 +62,30 @@ class HitboxLoader:
         print(f"[HitboxLoader]   Searched: {search_paths}")
         return False
     
+    @staticmethod
+    def _build_boxes(hitboxes: List[Dict]) -> List[Tuple[int, int, int, int, str]]:
+        """Flatten hitbox dicts into (x1, y1, x2, y2, id) tuples."""
+        boxes = []
+        for hitbox in hitboxes:
+            hx = hitbox.get('x', 0)
+            hy = hitbox.get('y', 0)
+            hw = hitbox.get('w', hitbox.get('width', 0))
+            hh = hitbox.get('h', hitbox.get('height', 0))
+            boxes.append((hx, hy, hx + hw, hy + hh, hitbox.get('id', 'unknown')))
+        return boxes
+    
+    def get_boxes(self, filename: str) -> List[Tuple[int, int, int, int, str]]:
+        """
+        Get precomputed hitbox rectangles for fast hit testing.
+        
+        Args:
+            filename: Hitbox file
+        
+        Returns:
+            List of (x1, y1, x2, y2, id) tuples (empty if not loaded)
+        """
+        return self._boxes.get(filename, [])
+    
     def check_hit(self, filename: str, x: int, y: int) -> Optional[str]:
         """
         Check if coordinates hit any hitbox.
@@ -71,17 +97,9 @@ class HitboxLoader:
         Returns:
             Hitbox ID or None
         """
-        if filename not in self.hitboxes:
-            return None
-        
-        for hitbox in self.hitboxes[filename]:
-            hx = hitbox.get('x', 0)
-            hy = hitbox.get('y', 0)
-            hw = hitbox.get('w', hitbox.get('width', 0))
-            hh = hitbox.get('h', hitbox.get('height', 0))
-            
-            if hx <= x < hx + hw and hy <= y < hy + hh:
-                return hitbox.get('id', 'unknown')
+        for x1, y1, x2, y2, hid in self._boxes.get(filename, ()):
+            if x1 <= x < x2 and y1 <= y < y2:
+                return hid
         
         return None
     
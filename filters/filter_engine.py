@@ -4,6 +4,24 @@ import numpy as np
 from typing import Optional, Callable, Dict
 from enum import Enum
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _lut_kernel(src, dst, lut):
+        """Single-pass per-channel LUT lookup (src and dst are HxWx3 uint8)."""
+        h, w = src.shape[0], src.shape[1]
+        for y in prange(h):
+            for x in range(w):
+                for c in range(3):
+                    dst[y, x, c] = lut[src[y, x, c], c]
+else:
+    _lut_kernel = None
+
 
 class FilterType(Enum):
     """Available filter types."""
@@ -83,6 +101,10 @@ class FilterEngine:
         if filter_type == FilterType.NONE:
             return frame
         
+        # LUT filters write a fresh output array, no input copy needed
+        if filter_type in (FilterType.WARM, FilterType.COLD):
+            return self._apply_lut_per_channel(frame, self._luts[filter_type])
+        
         # Copy frame (avoid modifying input)
         output = frame.copy()
         
@@ -125,14 +147,6 @@ class FilterEngine:
             output[:,:,1] = (output[:,:,1] * 0.8).astype(np.uint8)
             output[:,:,2] = np.clip(output[:,:,2].astype(np.float32) * 1.2, 0, 255).astype(np.uint8)
         
-        elif filter_type == FilterType.WARM:
-            # Apply warm LUT
-            output = self._apply_lut_per_channel(output, self._luts[FilterType.WARM])
-        
-        elif filter_type == FilterType.COLD:
-            # Apply cold LUT
-            output = self._apply_lut_per_channel(output, self._luts[FilterType.COLD])
-        
         elif filter_type == FilterType.ORANGE:
             # Orange tint
             output[:,:,0] = np.clip(output[:,:,0].astype(np.float32) * 1.4, 0, 255).astype(np.uint8)
@@ -149,7 +163,12 @@ class FilterEngine:
     
     def _apply_lut_per_channel(self, frame: np.ndarray, lut: np.ndarray) -> np.ndarray:
         """Apply LUT to each channel."""
-        output = frame.copy()
+        if _lut_kernel is not None:
+            output = np.empty_like(frame)
+            _lut_kernel(frame, output, lut)
+            return output
+        
+        output = np.empty_like(frame)
         output[:,:,0] = lut[frame[:,:,0], 0]
         output[:,:,1] = lut[frame[:,:,1], 1]
         output[:,:,2] = lut[frame[:,:,2], 2]
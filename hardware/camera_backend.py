@@ -81,8 +81,10 @@ class CameraBackend:
         cfg = self.camera.create_preview_configuration(
             main={"size": self.preview_size, "format": "RGB888"},
             lores={"size": self.preview_size, "format": "YUV420"},
-            buffer_count=3,
-            queue=True,
+            # Double-buffer only and no request queue: the viewfinder always
+            # gets the newest frame instead of one held back in the queue
+            buffer_count=2,
+            queue=False,
             controls={"FrameRate": float(self.preview_fps)}
         )
         self.camera.configure(cfg)
@@ -12,34 +12,44 @@ class FlashLED:
     Controls LED via GPIO through BC337 transistor.
     """
     
-    def __init__(self, pin: int = 27, max_duration_ms: int = 200):
+    def __init__(self, pin: int = 27, max_duration_ms: int = 200, settle_ms: int = 50):
         """
         Initialize flash LED.
         
         Args:
             pin: BCM GPIO pin
             max_duration_ms: Maximum pulse duration for safety
+            settle_ms: Time for LED output to stabilize after switching on
         """
         self.led = OutputDevice(pin, initial_value=False)
         self.max_duration_ms = max_duration_ms
+        self.settle_ms = settle_ms
         
         # Safety: watchdog timer
         self._watchdog_timer: Optional[threading.Timer] = None
         self._is_on = False
         
+        # Switch-on time (for settle wait) + deferred off
+        self._on_ns = 0
+        self._off_timer: Optional[threading.Timer] = None
+        
         print(f"[Flash LED] Initialized on GPIO{pin}")
     
     def on(self) -> None:
         """Turn flash LED on."""
+        self._cancel_off_timer()
         if not self._is_on:
             self.led.on()
             self._is_on = True
             
+            self._on_ns = time.monotonic_ns()
+            
             # Safety watchdog: force off after max duration
             self._start_watchdog()
     
     def off(self) -> None:
         """Turn flash LED off."""
+        self._cancel_off_timer()
         if self._is_on:
             self.led.off()
             self._is_on = False
@@ -47,6 +57,31 @@ class FlashLED:
             # Cancel watchdog
             self._cancel_watchdog()
     
+    def wait_settled(self) -> bool:
+        """
+        Sleep for whatever remains of settle_ms since the LED was switched on.
+        
+        Returns:
+            True if LED is on (and now settled), False if it is off
+        """
+        if not self._is_on:
+            return False
+        remaining_ns = self.settle_ms * 1_000_000 - (time.monotonic_ns() - self._on_ns)
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1e9)
+        return True
+    
+    def off_after(self, delay_ms: int) -> None:
+        """
+        Turn flash LED off after a delay without blocking the caller.
+        
+        Args:
+            delay_ms: Delay in milliseconds
+        """
+        self._cancel_off_timer()
+        self._off_timer = threading.Timer(delay_ms / 1000.0, self.off)
+        self._off_timer.start()
+    
     def pulse(self, duration_ms: int) -> None:
         """
         Pulse flash LED for specified duration.
@@ -88,6 +123,13 @@ class FlashLED:
         )
         self._watchdog_timer.start()
     
+    def _cancel_off_timer(self) -> None:
+        """Cancel pending deferred off."""
+        timer = self._off_timer
+        if timer and timer is not threading.current_thread():
+            timer.cancel()
+        self._off_timer = None
+    
     def _cancel_watchdog(self) -> None:
         """Cancel watchdog timer."""
         if self._watchdog_timer:
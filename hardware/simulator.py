@@ -6,6 +6,7 @@ These are the DEFAULT backends when not on Raspberry Pi.
 import pygame
 import numpy as np
 import time
+import threading
 from typing import Optional, Callable
 
 
@@ -199,18 +200,44 @@ class GyroscopeSimulator:
 class FlashLEDSimulator:
     """Simulated flash LED."""
     
-    def __init__(self, pin=27, max_duration_ms=200):
+    def __init__(self, pin=27, max_duration_ms=200, settle_ms=50):
         self.is_on = False
+        self.settle_ms = settle_ms
+        self._on_ns = 0
+        self._off_timer = None
         print("[FlashSim] Initialized")
     
     def on(self):
+        self._cancel_off_timer()
+        if not self.is_on:
+            self._on_ns = time.monotonic_ns()
         self.is_on = True
         print("[FlashSim] ON")
     
     def off(self):
+        self._cancel_off_timer()
         self.is_on = False
         print("[FlashSim] OFF")
     
+    def wait_settled(self) -> bool:
+        if not self.is_on:
+            return False
+        remaining_ns = self.settle_ms * 1_000_000 - (time.monotonic_ns() - self._on_ns)
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1e9)
+        return True
+    
+    def off_after(self, delay_ms: int):
+        self._cancel_off_timer()
+        self._off_timer = threading.Timer(delay_ms / 1000.0, self.off)
+        self._off_timer.start()
+    
+    def _cancel_off_timer(self):
+        timer = self._off_timer
+        if timer and timer is not threading.current_thread():
+            timer.cancel()
+        self._off_timer = None
+    
     def pulse(self, duration_ms: int):
         self.on()
         time.sleep(duration_ms / 1000.0)
@@ -35,29 +35,45 @@ class CameraScene:
         self.zoom_step = app.config.get('zoom', 'step', default=0.05)
         self.zoom_smooth = app.config.get('zoom', 'smooth_factor', default=0.25)
         
+        # ISO at which the filter engine applies unity gain
+        self._default_iso = 400
+        
+        # Last resolved filter enum (avoids enum lookup every frame)
+        self._last_filter_str = 'none'
+        self._last_filter_type = FilterType.NONE
+        
         # Load hitboxes
         from core.hitbox_loader import HitboxLoader
         self.hitbox_loader = HitboxLoader()
         self.hitbox_loader.load("hitboxes_main.json")
+        self._main_boxes = self.hitbox_loader.get_boxes("hitboxes_main.json")
         
         # UI overlays (PNGs loaded by resource manager)
-        self.flash_overlays = {
-            'off': app.resource_manager.get_image("ui/flash off.png"),
-            'on': app.resource_manager.get_image("ui/flash on.png"),
-            'auto': app.resource_manager.get_image("ui/flash automatically.png")
+        self._flash_overlay_paths = {
+            'off': "ui/flash off.png",
+            'on': "ui/flash on.png",
+            'auto': "ui/flash automatically.png"
         }
+        self._button_size = 75
         
         # Icons
         self.settings_icon = app.resource_manager.get_image("ui/settings.png")
         self.gallery_icon = app.resource_manager.get_image("ui/gallery.png")
         
+        # Overlays scaled + converted to display format (built in on_enter)
+        self._overlay_cache = {}
+        
         # Performance tracking
         self.frame_count = 0
         self.fps = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = pygame.time.get_ticks()
         self._debug_frame_logs = bool(app.config.get('ui', 'debug_frame_logs', default=False))
         self._last_no_frame_log = 0.0
         
+        # Info bar values (refreshed at 1 Hz)
+        self._battery_cache = None
+        self._info_cache_time = 0
+        
         # Fonts with fallback
         try:
             self.font_regular = app.resource_manager.load_font("fonts/Inter_regular.ttf", 20)
@@ -79,6 +95,18 @@ class CameraScene:
         
         self.zoom_current = self.app.config.get('zoom', 'current', default=1.0)
         self.zoom_target = self.zoom_current
+        
+        # Display is initialized by now: scale + convert button overlays once.
+        # Full-screen flash overlays are only pre-built when they will be drawn.
+        prebuild_fullscreen = self.app.config.get('ui', 'flash_overlay_enabled', default=False)
+        screen_w = self.app.config.get('display', 'width', default=480)
+        screen_h = self.app.config.get('display', 'height', default=800)
+        for overlay_path in self._flash_overlay_paths.values():
+            if prebuild_fullscreen:
+                self._get_overlay(overlay_path, (screen_w, screen_h))
+            self._get_overlay(overlay_path, (self._button_size, self._button_size))
+        for overlay_path in ("ui/settings.png", "ui/gallery.png"):
+            self._get_overlay(overlay_path, (self._button_size, self._button_size))
     
     def on_exit(self):
         """Stop camera preview."""
@@ -95,7 +123,11 @@ class CameraScene:
             mx, my = event.pos
             
             # Check hitboxes
-            hit_id = self.hitbox_loader.check_hit("hitboxes_main.json", mx, my)
+            hit_id = None
+            for x1, y1, x2, y2, hid in self._main_boxes:
+                if x1 <= mx < x2 and y1 <= my < y2:
+                    hit_id = hid
+                    break
             
             if hit_id == 'settings':
                 logger.info("Opening Settings")
@@ -156,7 +188,7 @@ class CameraScene:
         # Flash on
         if use_flash and self.app.flash_led:
             self.app.flash_led.on()
-            time.sleep(0.05)
+            self.app.flash_led.wait_settled()
         
         # Capture frame
         if not self.app.camera:
@@ -175,17 +207,19 @@ class CameraScene:
                 self.app.haptic.play_effect(14, 0.8)
             return
         
-        # Flash off
+        # Flash off (deferred, keeps the capture path non-blocking)
         if use_flash and self.app.flash_led:
-            time.sleep(0.05)
-            self.app.flash_led.off()
+            self.app.flash_led.off_after(50)
         
         # Apply filter + ISO
         filter_type_str = self.app.config.get('filter', 'active', default='none')
         iso_value = self.app.config.get('filter', 'iso_fake', default=400)
         
-        filter_type = FilterType(filter_type_str)
-        processed_frame = self.filter_engine.process_frame(raw_frame, filter_type, iso_value)
+        if filter_type_str == 'none' and iso_value == self._default_iso:
+            processed_frame = raw_frame
+        else:
+            filter_type = self._get_filter_type(filter_type_str)
+            processed_frame = self.filter_engine.process_frame(raw_frame, filter_type, iso_value)
         
         # Save to photo store
         filepath = self.photo_store.save_photo(processed_frame, extension='jpg')
@@ -234,13 +268,15 @@ class CameraScene:
         if abs(self.zoom_target - self.zoom_current) > 0.001:
             self.zoom_current += (self.zoom_target - self.zoom_current) * self.zoom_smooth
         
-        # Update freeze frame
-        self.app.freeze_frame.update()
+        # Update freeze frame (inactive case is a single attribute check)
+        freeze_frame = self.app.freeze_frame
+        if freeze_frame.is_active:
+            freeze_frame.update()
         
         # FPS tracking
         self.frame_count += 1
-        current_time = time.time()
-        if current_time - self.last_fps_time >= 1.0:
+        current_time = pygame.time.get_ticks()
+        if current_time - self.last_fps_time >= 1000:
             self.fps = self.frame_count
             self.frame_count = 0
             self.last_fps_time = current_time
@@ -277,12 +313,16 @@ class CameraScene:
             if self._debug_frame_logs:
                 logger.debug(f"[RENDER] Converting numpy frame: {frame.shape}")
             filter_type_str = self.app.config.get('filter', 'active', default='none')
-            filter_type = FilterType(filter_type_str)
             iso_value = self.app.config.get('filter', 'iso_fake', default=400)
 
-            filtered_frame = self.filter_engine.process_frame(frame, filter_type, iso_value)
-            zoomed_frame = self._apply_zoom(filtered_frame)
-            surf = self._frame_to_surface(zoomed_frame)
+            # Crop first so filters only touch the visible pixels
+            zoomed_frame = self._apply_zoom(frame)
+            if filter_type_str == 'none' and iso_value == self._default_iso:
+                filtered_frame = zoomed_frame
+            else:
+                filter_type = self._get_filter_type(filter_type_str)
+                filtered_frame = self.filter_engine.process_frame(zoomed_frame, filter_type, iso_value)
+            surf = self._frame_to_surface(filtered_frame)
 
             if surf:
                 screen.blit(surf, (0, 0))
@@ -332,30 +372,33 @@ class CameraScene:
         if info_mode != 'off':
             self._render_info_bar(screen, info_mode)
         
+        # Final composite (flash overlay + FPS text) issued as one blits() call
+        blit_list = []
+        
         # Optional flash overlay. Disabled by default because some placeholder PNGs
         # can cover the camera image with opaque white regions.
         if self.app.config.get('ui', 'flash_overlay_enabled', default=False):
             flash_mode = self.app.config.get('flash', 'mode', default='off')
-            flash_overlay = self.flash_overlays.get(flash_mode)
-            if flash_overlay:
+            overlay_path = self._flash_overlay_paths.get(flash_mode)
+            if overlay_path:
                 screen_w = self.app.config.get('display', 'width', default=480)
                 screen_h = self.app.config.get('display', 'height', default=800)
-
-                overlay_size = flash_overlay.get_size()
-                if overlay_size != (screen_w, screen_h):
-                    flash_overlay = pygame.transform.scale(flash_overlay, (screen_w, screen_h))
-
-                screen.blit(flash_overlay, (0, 0))
+                flash_overlay = self._get_overlay(overlay_path, (screen_w, screen_h))
+                if flash_overlay:
+                    blit_list.append((flash_overlay, (0, 0)))
         
         # FPS counter - only render if enabled in config
         fps_counter_enabled = self.app.config.get('ui', 'fps_counter_enabled', default=False)
         if fps_counter_enabled and self.fps > 0:
             try:
                 fps_surf = self.font_regular.render(f"{self.fps} FPS", True, (0, 255, 0))
-                screen.blit(fps_surf, (10, 40))
+                blit_list.append((fps_surf, (10, 40)))
             except Exception as e:
                 logger.error(f"Failed to render FPS counter: {e}")
         
+        if blit_list:
+            screen.blits(blit_list, doreturn=False)
+        
         # UI BUTTONS OVERLAY (Settings, Gallery, Flash)
         self._render_ui_buttons(screen)
     
@@ -388,6 +431,13 @@ class CameraScene:
         # it appears on top of all other content
         pass
     
+    def _get_filter_type(self, filter_type_str: str) -> FilterType:
+        """Resolve filter config string to FilterType (memoized on last value)."""
+        if filter_type_str != self._last_filter_str:
+            self._last_filter_type = FilterType(filter_type_str)
+            self._last_filter_str = filter_type_str
+        return self._last_filter_type
+    
     def _apply_zoom(self, frame: np.ndarray) -> np.ndarray:
         """Apply zoom by cropping center."""
         if self.zoom_current <= 1.01:
@@ -469,16 +519,21 @@ class CameraScene:
         if mode == 'off':
             return
         
-        from datetime import datetime
-        
-        battery_pct = self.app.sensor_thread.get_battery() if hasattr(self.app, 'sensor_thread') else None
-        if battery_pct is None and self.app.battery:
-            battery_pct = self.app.battery.read_percentage()
+        # Battery reading only changes slowly: refresh at most once per second
+        now = pygame.time.get_ticks()
+        if now - self._info_cache_time > 1000 or self._info_cache_time == 0:
+            battery_pct = self.app.sensor_thread.get_battery() if hasattr(self.app, 'sensor_thread') else None
+            if battery_pct is None and self.app.battery:
+                battery_pct = self.app.battery.read_percentage()
+            
+            self._battery_cache = battery_pct
+            self._info_cache_time = now
         
-        datetime_str = datetime.now().strftime("%Y-%m-%d %H:%M")
+        # Renderer re-formats the clock only when the second changes
+        self.app.overlay_renderer.prepare(self._battery_cache, time.time())
         
         if mode == 'minimal':
-            self.app.overlay_renderer.render_minimal(screen, battery_pct, datetime_str)
+            self.app.overlay_renderer.render_minimal(screen)
         
         elif mode == 'extended':
             lux = self.app.sensor_thread.get_lux() if hasattr(self.app, 'sensor_thread') else None
@@ -489,17 +544,33 @@ class CameraScene:
             photo_count = self.photo_store.get_photo_count()
             
             self.app.overlay_renderer.render_extended(
-                screen, battery_pct, datetime_str,
+                screen, None, None,
                 lux, self.zoom_current, filter_name, photo_count
             )
     
+    def _get_overlay(self, relative_path: str, size: tuple) -> Optional[pygame.Surface]:
+        """Get overlay PNG scaled to size and converted to display format (cached)."""
+        key = (relative_path, size)
+        overlay = self._overlay_cache.get(key)
+        if overlay is None:
+            source = self.app.resource_manager.get_image(relative_path)
+            if source is None:
+                return None
+            overlay = source
+            if overlay.get_size() != size:
+                overlay = pygame.transform.scale(overlay, size)
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert_alpha()
+            self._overlay_cache[key] = overlay
+        return overlay
+    
     def _render_ui_buttons(self, screen: pygame.Surface):
         """Render UI button overlays from assets at exact hitbox coordinates."""
         try:
             # Bottom button bar - MUCH LARGER and more visible
             button_y = 710  # From bottom: 800 - 90 = 710
-            button_h = 75   # LARGER: 75px height
-            button_w = 75   # LARGER: 75px width
+            button_h = self._button_size   # LARGER: 75px height
+            button_w = self._button_size   # LARGER: 75px width
             button_spacing = 35  # Gap between buttons
             
             # Calculate starting X to center buttons horizontally
@@ -508,9 +579,8 @@ class CameraScene:
             
             # SETTINGS - Left button
             settings_x = start_x
-            settings_overlay = self.app.resource_manager.get_image("ui/settings.png")
-            if settings_overlay:
-                settings_scaled = pygame.transform.scale(settings_overlay, (button_w, button_h))
+            settings_scaled = self._get_overlay("ui/settings.png", (button_w, button_h))
+            if settings_scaled:
                 screen.blit(settings_scaled, (settings_x, button_y))
                 # DEBUG: Draw white border around button so it's visible
                 pygame.draw.rect(screen, (255, 255, 255), (settings_x, button_y, button_w, button_h), 2)
@@ -523,15 +593,10 @@ class CameraScene:
             # FLASH - Middle button
             flash_x = start_x + button_w + button_spacing
             flash_mode = self.app.config.get('flash', 'mode', default='off')
-            if flash_mode == 'on':
-                flash_overlay = self.app.resource_manager.get_image("ui/flash on.png")
-            elif flash_mode == 'auto':
-                flash_overlay = self.app.resource_manager.get_image("ui/flash automatically.png")
-            else:  # 'off'
-                flash_overlay = self.app.resource_manager.get_image("ui/flash off.png")
+            overlay_path = self._flash_overlay_paths.get(flash_mode, self._flash_overlay_paths['off'])
+            flash_scaled = self._get_overlay(overlay_path, (button_w, button_h))
             
-            if flash_overlay:
-                flash_scaled = pygame.transform.scale(flash_overlay, (button_w, button_h))
+            if flash_scaled:
                 screen.blit(flash_scaled, (flash_x, button_y))
                 # DEBUG: Draw white border
                 pygame.draw.rect(screen, (255, 255, 255), (flash_x, button_y, button_w, button_h), 2)
@@ -543,9 +608,8 @@ class CameraScene:
             
             # GALLERY - Right button
             gallery_x = start_x + 2 * (button_w + button_spacing)
-            gallery_overlay = self.app.resource_manager.get_image("ui/gallery.png")
-            if gallery_overlay:
-                gallery_scaled = pygame.transform.scale(gallery_overlay, (button_w, button_h))
+            gallery_scaled = self._get_overlay("ui/gallery.png", (button_w, button_h))
+            if gallery_scaled:
                 screen.blit(gallery_scaled, (gallery_x, button_y))
                 # DEBUG: Draw white border
                 pygame.draw.rect(screen, (255, 255, 255), (gallery_x, button_y, button_w, button_h), 2)
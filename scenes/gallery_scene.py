@@ -4,6 +4,7 @@ WITH DELETE FUNCTION.
 """
 
 import pygame
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -28,6 +29,10 @@ class GalleryScene:
         self.surface_cache = {}
         self.MAX_CACHE_SIZE = 2  # Each photo surface ~1.2 MB
         
+        # Background JPEG decode (keeps swipes responsive)
+        self._loader = ThreadPoolExecutor(max_workers=1)
+        self._pending = {}  # index -> (path, future)
+        
         # Gesture detection
         from core.gesture_detector import GestureDetector
         self.gesture_detector = GestureDetector()
@@ -55,6 +60,7 @@ class GalleryScene:
         self.photos = self.photo_store.list_photos()
         self.current_index = 0
         self.surface_cache.clear()
+        self._cancel_pending()
         
         print(f"[GalleryScene] Loaded {len(self.photos)} photos")
         
@@ -64,6 +70,7 @@ class GalleryScene:
     def on_exit(self):
         """Clear cache on exit."""
         self.surface_cache.clear()
+        self._cancel_pending()
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
@@ -104,6 +111,7 @@ class GalleryScene:
             return
         
         self.current_index = (self.current_index - 1) % len(self.photos)
+        self._cancel_pending(keep=self.current_index)
         self._load_photo_surface(self.current_index)
     
     def _next_photo(self):
@@ -112,6 +120,7 @@ class GalleryScene:
             return
         
         self.current_index = (self.current_index + 1) % len(self.photos)
+        self._cancel_pending(keep=self.current_index)
         self._load_photo_surface(self.current_index)
     
     def _delete_current_photo(self):
@@ -128,6 +137,7 @@ class GalleryScene:
             # Refresh photos list
             self.photos = self.photo_store.list_photos()
             self.surface_cache.clear()
+            self._cancel_pending()
             
             # Adjust index
             if not self.photos:
@@ -142,8 +152,25 @@ class GalleryScene:
         except Exception as e:
             print(f"[Gallery] Delete failed: {e}")
     
+    def _cancel_pending(self, keep: Optional[int] = None):
+        """
+        Cancel and drop queued decodes for photos no longer on screen.
+        
+        Args:
+            keep: Index whose decode should stay in flight (None = drop all)
+        """
+        for index in list(self._pending):
+            if index != keep:
+                # A decode already running can't be cancelled; its result is discarded
+                self._pending.pop(index)[1].cancel()
+    
     def _load_photo_surface(self, index: int) -> Optional[pygame.Surface]:
-        """Load photo as pygame surface (with caching)."""
+        """
+        Get photo as pygame surface (with caching).
+        
+        Decoding runs on a background worker; returns None until the
+        photo is ready (render shows a placeholder meanwhile).
+        """
         if index < 0 or index >= len(self.photos):
             return None
         
@@ -151,39 +178,58 @@ class GalleryScene:
         if index in self.surface_cache:
             return self.surface_cache[index]
         
-        # Load from disk
-        try:
-            photo_path = self.photos[index]
-            
-            from PIL import Image
-            img = Image.open(photo_path)
-            
-            # Resize to fit screen
+        photo_path = self.photos[index]
+        
+        pending = self._pending.get(index)
+        if pending is None or pending[0] != photo_path:
+            # Submit decode
             screen_w = self.app.config.get('display', 'width', default=480)
             screen_h = self.app.config.get('display', 'height', default=800)
+            future = self._loader.submit(self._decode_photo, photo_path, screen_w, screen_h)
+            self._pending[index] = (photo_path, future)
+            return None
+        
+        future = pending[1]
+        if not future.done():
+            return None
+        
+        del self._pending[index]
+        
+        try:
+            img = future.result()
             
-            img.thumbnail((screen_w, screen_h), Image.Resampling.LANCZOS)
-            
-            # Convert to pygame surface
-            mode = img.mode
-            size = img.size
-            data = img.tobytes()
-            
-            surf = pygame.image.fromstring(data, size, mode)
-            
-            # Manage cache size - keep only N recent photos cached (memory efficient for Pi 3A+)
-            if len(self.surface_cache) >= self.MAX_CACHE_SIZE:
-                # Remove oldest cached photo
-                oldest_key = min(self.surface_cache.keys())
-                del self.surface_cache[oldest_key]
-            
-            self.surface_cache[index] = surf
-            
-            return surf
-            
+            # frombuffer wraps the bytes directly (fromstring would copy them again)
+            surf = pygame.image.frombuffer(img.tobytes(), img.size, img.mode)
         except Exception as e:
             print(f"[GalleryScene] Load photo failed: {e}")
-            return None
+            surf = None
+        
+        # Manage cache size - keep only N recent photos cached (memory efficient for Pi 3A+)
+        if len(self.surface_cache) >= self.MAX_CACHE_SIZE:
+            # Remove oldest cached photo
+            oldest_key = min(self.surface_cache.keys())
+            del self.surface_cache[oldest_key]
+        
+        # Failed decodes are cached as None so they are not retried every frame
+        self.surface_cache[index] = surf
+        
+        return surf
+    
+    @staticmethod
+    def _decode_photo(photo_path: Path, screen_w: int, screen_h: int):
+        """Decode and downscale photo with PIL (runs on loader thread)."""
+        from PIL import Image
+        img = Image.open(photo_path)
+        
+        # Let libjpeg decode at a reduced DCT scale (no-op for other formats)
+        img.draft('RGB', (screen_w, screen_h))
+        
+        img.thumbnail((screen_w, screen_h), Image.Resampling.LANCZOS)
+        
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGB')
+        
+        return img
     
     def handle_encoder_rotation(self, delta: int):
         """Handle encoder rotation."""
@@ -199,9 +245,11 @@ class GalleryScene:
     def render(self, screen: pygame.Surface):
         """Render gallery with Apple Photos-style dark mode design."""
         # Deep dark background (like iOS dark mode)
-        screen.fill((10, 10, 12))
+        bg_color = (10, 10, 12)
         
         if not self.photos:
+            screen.fill(bg_color)
+            
             # Empty state - minimal, elegant
             no_photos_surf = self.font_title.render("No Photos", True, (120, 120, 130))
             no_photos_rect = no_photos_surf.get_rect(center=(240, 380))
@@ -229,11 +277,21 @@ class GalleryScene:
                 # Center photo with subtle shadow background
                 photo_rect = scaled_surf.get_rect(center=(240, 360))
                 
+                # Photo covers its rect: only clear the strips around it
+                for bg_rect in self._rects_around(screen.get_rect(), photo_rect):
+                    screen.fill(bg_color, bg_rect)
+                
                 # Draw subtle shadow/border (iOS style)
                 shadow_rect = photo_rect.inflate(8, 8)
                 pygame.draw.rect(screen, (30, 30, 35), shadow_rect, border_radius=12)
                 
                 screen.blit(scaled_surf, photo_rect)
+            else:
+                screen.fill(bg_color)
+                if self.current_index not in self.surface_cache:
+                    # Placeholder while the photo decodes
+                    loading_surf = self.font_info.render("Loading…", True, (80, 80, 90))
+                    screen.blit(loading_surf, loading_surf.get_rect(center=(240, 360)))
             
             # Photo info at top (minimal, elegant)
             self._render_photo_header(screen)
@@ -245,6 +303,17 @@ class GalleryScene:
         if self.gallery_overlay:
             screen.blit(self.gallery_overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
     
+    @staticmethod
+    def _rects_around(bounds: pygame.Rect, inner: pygame.Rect) -> List[pygame.Rect]:
+        """Split bounds minus inner into top/bottom/left/right strips."""
+        inner = inner.clip(bounds)
+        return [
+            pygame.Rect(bounds.left, bounds.top, bounds.width, inner.top - bounds.top),
+            pygame.Rect(bounds.left, inner.bottom, bounds.width, bounds.bottom - inner.bottom),
+            pygame.Rect(bounds.left, inner.top, inner.left - bounds.left, inner.height),
+            pygame.Rect(inner.right, inner.top, bounds.right - inner.right, inner.height),
+        ]
+    
     def _render_photo_header(self, screen: pygame.Surface):
         """Render header with photo count - iOS style."""
         if not self.photos or self.current_index >= len(self.photos):
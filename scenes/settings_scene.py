@@ -4,15 +4,51 @@ Full keyboard + encoder + touch navigation.
 """
 
 import pygame
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 
+class Setting:
+    """Single settings entry (slots for fast attribute access in render)."""
+    
+    __slots__ = ('label', 'type', 'config_path', 'choices', 'default',
+                 'choice_index', 'action', 'description', 'value',
+                 'step', 'min', 'max')
+    
+    def __init__(self, label: str, type: str,
+                 config_path: Optional[Tuple[str, str]] = None,
+                 choices: Optional[List[Any]] = None,
+                 default: Any = None,
+                 action: Optional[str] = None,
+                 description: str = '',
+                 value: Any = '',
+                 step: int = 1, min: int = 0, max: int = 100):
+        self.label = label
+        self.type = type
+        self.config_path = config_path
+        self.choices = choices
+        self.default = default
+        self.action = action
+        self.description = description
+        self.value = value
+        self.step = step
+        self.min = min
+        self.max = max
+        
+        # value -> index lookup for choice settings
+        self.choice_index = {v: i for i, v in enumerate(choices)} if choices else {}
+
+
 class SettingsScene:
     """
     Settings menu with 10 configurable options.
     """
     
+    # List layout (cells are 50px tall on a 52px pitch)
+    LIST_START_Y = 85
+    ITEM_HEIGHT = 52
+    
     def __init__(self, app):
         """Initialize settings scene."""
         self.app = app
@@ -21,11 +57,39 @@ class SettingsScene:
         self.selected_index = 0
         self.edit_mode = False
         
+        # Current config values keyed by config_path (updated on write)
+        self._value_cache: Dict[tuple, Any] = {}
+        
+        # Clock string for datetime entries (refreshed once per second)
+        self._time_cache_str = ''
+        self._time_cache_sec = 0
+        
+        # Brightness levels per mode (read from config on first use)
+        self._brightness_values: Optional[Dict[str, int]] = None
+        
+        # Debounced config write (one save after the encoder stops)
+        self._save_deadline: Optional[float] = None
+        
+        # Rendered text surfaces keyed by (text, color)
+        self._label_cache: Dict[tuple, pygame.Surface] = {}
+        self._value_surf_cache: Dict[tuple, pygame.Surface] = {}
+        
+        # Pre-composed screen (overlay + settings list), rebuilt only when dirty
+        self._composite = pygame.Surface((480, 800))
+        
+        # Reused text rects (repositioned per cell instead of allocated)
+        self._label_rect = pygame.Rect(0, 0, 0, 0)
+        self._value_rect = pygame.Rect(0, 0, 0, 0)
+        self._dirty = True
+        
         # Build settings list
         self._build_settings_list()
         
         # Load settings overlay PNG
         self.settings_overlay = app.resource_manager.get_image("ui/settings.png")
+        if self.settings_overlay and pygame.display.get_surface() is not None:
+            # Own copy in display format (cheap no-op conversion if already converted)
+            self.settings_overlay = self.settings_overlay.convert_alpha()
         
         # Fonts
         try:
@@ -50,62 +114,66 @@ class SettingsScene:
     def _build_settings_list(self):
         """Build simplified settings list - only working options."""
         self.settings = [
-            {
-                'label': 'Brightness',
-                'type': 'choice',
-                'config_path': ('display', 'brightness_mode'),
-                'choices': ['dark', 'medium', 'bright', 'auto'],
-                'default': 'medium'
-            },
-            {
-                'label': 'Filter',
-                'type': 'choice',
-                'config_path': ('filter', 'active'),
-                'choices': ['none', 'warm', 'cold', 'monochrom'],
-                'default': 'none'
-            },
-            {
-                'label': 'Flash Mode',
-                'type': 'choice',
-                'config_path': ('flash', 'mode'),
-                'choices': ['off', 'on', 'auto'],
-                'default': 'off'
-            },
-            {
-                'label': 'Grid Overlay',
-                'type': 'bool',
-                'config_path': ('ui', 'grid_enabled'),
-                'default': False
-            },
-            {
-                'label': 'Level Indicator',
-                'type': 'bool',
-                'config_path': ('ui', 'level_enabled'),
-                'default': False
-            },
-            {
-                'label': 'Info Display',
-                'type': 'choice',
-                'config_path': ('ui', 'info_display'),
-                'choices': ['off', 'minimal'],
-                'default': 'minimal'
-            },
-            {
-                'label': 'Shutdown Device',
-                'type': 'action',
-                'action': 'shutdown',
-                'description': 'Gracefully shut down Pi'
-            },
+            Setting('Brightness', 'choice',
+                    config_path=('display', 'brightness_mode'),
+                    choices=['dark', 'medium', 'bright', 'auto'],
+                    default='medium'),
+            Setting('Filter', 'choice',
+                    config_path=('filter', 'active'),
+                    choices=['none', 'warm', 'cold', 'monochrom'],
+                    default='none'),
+            Setting('Flash Mode', 'choice',
+                    config_path=('flash', 'mode'),
+                    choices=['off', 'on', 'auto'],
+                    default='off'),
+            Setting('Grid Overlay', 'bool',
+                    config_path=('ui', 'grid_enabled'),
+                    default=False),
+            Setting('Level Indicator', 'bool',
+                    config_path=('ui', 'level_enabled'),
+                    default=False),
+            Setting('Info Display', 'choice',
+                    config_path=('ui', 'info_display'),
+                    choices=['off', 'minimal'],
+                    default='minimal'),
+            Setting('Shutdown Device', 'action',
+                    action='shutdown',
+                    description='Gracefully shut down Pi'),
+        ]
+        
+        # Parallel per-field lists for the render loop (settings stays the authoring form)
+        self._labels = [setting.label for setting in self.settings]
+        self._types = [setting.type for setting in self.settings]
+        self._paths = [setting.config_path for setting in self.settings]
+        self._defaults = [setting.default if setting.config_path else setting.value
+                          for setting in self.settings]
+        self._has_clock = 'datetime' in self._types
+        
+        # Cell geometry shared by render and touch hit testing
+        self._item_rects = [
+            pygame.Rect(15, self.LIST_START_Y + i * self.ITEM_HEIGHT - 3, 450, 50)
+            for i in range(len(self.settings))
         ]
     
     def on_enter(self):
         """Called when entering scene."""
         self.selected_index = 0
         self.edit_mode = False
+        
+        # Config may have changed elsewhere (e.g. flash hitbox in camera scene)
+        self._value_cache.clear()
+        self.invalidate_brightness_cache()
+        self._dirty = True
     
     def on_exit(self):
         """Called when exiting scene."""
-        pass
+        self._flush_config()
+    
+    def _flush_config(self):
+        """Write pending config changes to disk."""
+        if self._save_deadline is not None:
+            self.app.config.save()
+            self._save_deadline = None
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
@@ -126,8 +194,10 @@ class SettingsScene:
                 # Navigation mode
                 if event.key == pygame.K_UP:
                     self.selected_index = max(0, self.selected_index - 1)
+                    self._dirty = True
                 elif event.key == pygame.K_DOWN:
                     self.selected_index = min(len(self.settings) - 1, self.selected_index + 1)
+                    self._dirty = True
                 elif event.key in [pygame.K_RETURN, pygame.K_SPACE]:
                     self._activate_setting()
                 elif event.key == pygame.K_ESCAPE:
@@ -140,24 +210,17 @@ class SettingsScene:
             clicked_index = self._get_clicked_setting(mx, my)
             if clicked_index is not None:
                 self.selected_index = clicked_index
+                self._dirty = True
                 self._activate_setting()
                 # Auto-increment value by touching (easier than encoder)
                 self._adjust_value(1)
             # Note: Back button hitbox is handled by main.py HitboxEngine
     
-    def _get_clicked_setting(self, x: int, y: int) -> int:
+    def _get_clicked_setting(self, x: int, y: int) -> Optional[int]:
         """Get setting index from click position."""
-        # Settings list starts at y=100, each item is 60px tall
-        start_y = 100
-        item_height = 60
-        
-        if y < start_y:
-            return None
-        
-        index = (y - start_y) // item_height
-        
-        if 0 <= index < len(self.settings):
-            return index
+        for i, rect in enumerate(self._item_rects):
+            if rect.collidepoint(x, y):
+                return i
         
         return None
     
@@ -165,66 +228,82 @@ class SettingsScene:
         """Activate/edit current setting."""
         setting = self.settings[self.selected_index]
         
-        if setting['type'] == 'action':
+        if setting.type == 'action':
             # Handle action buttons
-            action = setting.get('action')
+            action = setting.action
             if action == 'shutdown':
                 self.app.request_shutdown()
             return
         
-        if setting['type'] in ['choice', 'int', 'bool']:
+        if setting.type in ['choice', 'int', 'bool']:
             self.edit_mode = True
-        elif setting['type'] == 'datetime':
+        elif setting.type == 'datetime':
             # TODO: Show datetime picker
             print("[Settings] DateTime picker not implemented yet")
-        elif setting['type'] == 'info':
+        elif setting.type == 'info':
             # Just info, no action
             pass
     
     def _adjust_value(self, delta: int):
         """Adjust current setting value."""
         setting = self.settings[self.selected_index]
-        config_path = setting.get('config_path')
+        config_path = setting.config_path
         
         if not config_path:
             return
         
-        if setting['type'] == 'choice':
+        section, key = config_path
+        self._dirty = True
+        
+        if setting.type == 'choice':
             # Cycle through choices
-            choices = setting['choices']
-            current = self.app.config.get(config_path[0], config_path[1], default=setting['default'])
+            choices = setting.choices
+            current = self._get_value(config_path, setting.default)
             
-            try:
-                current_idx = choices.index(current)
-            except ValueError:
-                current_idx = 0
+            current_idx = setting.choice_index.get(current, 0)
             
             new_idx = (current_idx + delta) % len(choices)
             new_value = choices[new_idx]
             
-            self.app.config.set(config_path[0], config_path[1], value=new_value, save=True)
+            self.app.config.set(section, key, value=new_value, save=False)
+            self._save_deadline = time.monotonic() + 0.3
+            self._value_cache[config_path] = new_value
             
             # Apply immediately if brightness
             if config_path == ('display', 'brightness_mode'):
                 self._apply_brightness(new_value)
         
-        elif setting['type'] == 'int':
+        elif setting.type == 'int':
             # Increment/decrement
-            current = self.app.config.get(config_path[0], config_path[1], default=setting['default'])
-            step = setting.get('step', 1)
-            min_val = setting.get('min', 0)
-            max_val = setting.get('max', 100)
+            current = self._get_value(config_path, setting.default)
+            step = setting.step
+            min_val = setting.min
+            max_val = setting.max
             
             new_value = current + (delta * step)
             new_value = max(min_val, min(max_val, new_value))
             
-            self.app.config.set(config_path[0], config_path[1], value=new_value, save=True)
+            self.app.config.set(section, key, value=new_value, save=False)
+            self._save_deadline = time.monotonic() + 0.3
+            self._value_cache[config_path] = new_value
         
-        elif setting['type'] == 'bool':
+        elif setting.type == 'bool':
             # Toggle
-            current = self.app.config.get(config_path[0], config_path[1], default=setting['default'])
+            current = self._get_value(config_path, setting.default)
             new_value = not current
-            self.app.config.set(config_path[0], config_path[1], value=new_value, save=True)
+            self.app.config.set(section, key, value=new_value, save=False)
+            self._save_deadline = time.monotonic() + 0.3
+            self._value_cache[config_path] = new_value
+    
+    def _get_value(self, config_path: Tuple[str, str], default: Any) -> Any:
+        """Get current config value for a setting (cached)."""
+        try:
+            return self._value_cache[config_path]
+        except KeyError:
+            section, key = config_path
+            value = self.app.config.get(section, key, default=default)
+            self._value_cache[config_path] = value
+            return value
     
     def _apply_brightness(self, mode: str):
         """Apply brightness mode immediately."""
@@ -235,12 +314,17 @@ class SettingsScene:
             # Auto mode handled by sensor thread
             pass
         else:
-            values = {
-                'dark': self.app.config.get('display', 'brightness_dark', default=40),
-                'medium': self.app.config.get('display', 'brightness_medium', default=120),
-                'bright': self.app.config.get('display', 'brightness_bright', default=220)
-            }
-            self.app.brightness_ctrl.set_brightness(values.get(mode, 120))
+            if self._brightness_values is None:
+                self._brightness_values = {
+                    'dark': self.app.config.get('display', 'brightness_dark', default=40),
+                    'medium': self.app.config.get('display', 'brightness_medium', default=120),
+                    'bright': self.app.config.get('display', 'brightness_bright', default=220)
+                }
+            self.app.brightness_ctrl.set_brightness(self._brightness_values.get(mode, 120))
+    
+    def invalidate_brightness_cache(self):
+        """Drop cached brightness levels (call after editing brightness_* config)."""
+        self._brightness_values = None
     
     def handle_encoder_rotation(self, delta: int):
         """Handle encoder rotation."""
@@ -250,52 +334,91 @@ class SettingsScene:
             # Navigate
             self.selected_index += delta
             self.selected_index = max(0, min(len(self.settings) - 1, self.selected_index))
+            self._dirty = True
     
     def update(self, dt: float):
         """Update scene."""
-        pass
+        if self._save_deadline is not None and time.monotonic() >= self._save_deadline:
+            self._flush_config()
+        
+        # Clock rows only change once a minute: redraw when the shown time goes stale
+        if self._has_clock:
+            shown = self._time_cache_str
+            if self._get_time_str() != shown:
+                self._dirty = True
     
     def render(self, screen: pygame.Surface):
         """Render settings with overlay and settings list."""
-        screen.fill((20, 20, 20))
-        
-        # Display settings.png overlay first (background)
-        if self.settings_overlay:
-            screen.blit(self.settings_overlay, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        # Idle frames are pixel-identical: rebuild the composite only when dirty
+        if self._dirty:
+            composite = self._composite
+            composite.fill((20, 20, 20))
+            
+            # Display settings.png overlay first (background)
+            if self.settings_overlay:
+                composite.blit(self.settings_overlay, (0, 0))
+            
+            # Render settings list on top (clean, minimal style)
+            self._draw_settings_list(composite)
+            self._dirty = False
         
-        # Render settings list on top (clean, minimal style)
-        self._render_settings_list(screen)
+        screen.blit(self._composite, (0, 0))
+    
+    def _get_time_str(self) -> str:
+        """Current HH:MM, formatted at most once per second."""
+        now = int(time.time())
+        if now != self._time_cache_sec:
+            self._time_cache_sec = now
+            self._time_cache_str = datetime.now().strftime("%H:%M")
+        return self._time_cache_str
     
-    def _render_settings_list(self, screen: pygame.Surface):
-        """Render scrollable settings list - Apple dark mode style."""
+    @staticmethod
+    def _render_cached(font: pygame.font.Font, text: str, color: tuple,
+                       cache: Dict[tuple, pygame.Surface]) -> pygame.Surface:
+        """Render text once per (text, color) and reuse the surface."""
+        key = (text, color)
+        surf = cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            cache[key] = surf
+        return surf
+    
+    def _draw_settings_list(self, screen: pygame.Surface):
+        """Draw scrollable settings list - Apple dark mode style."""
         # Title
-        title_surf = self.font_title.render("Settings", True, (255, 255, 255))
+        title_surf = self._render_cached(self.font_title, "Settings", (255, 255, 255), self._label_cache)
         title_rect = title_surf.get_rect()
         title_rect.centerx = 240
         title_rect.top = 25
         screen.blit(title_surf, title_rect)
         
         # Settings items - iOS-style cells
-        start_y = 85
-        item_height = 52
+        start_y = self.LIST_START_Y
+        item_height = self.ITEM_HEIGHT
+        
+        labels = self._labels
+        types = self._types
+        paths = self._paths
+        defaults = self._defaults
         
-        for i, setting in enumerate(self.settings):
+        for i in range(len(labels)):
             # Get current value
-            config_path = setting.get('config_path')
+            config_path = paths[i]
+            setting_type = types[i]
             
             if config_path:
-                value = self.app.config.get(config_path[0], config_path[1], default=setting['default'])
+                value = self._get_value(config_path, defaults[i])
             else:
-                value = setting.get('value', '')
+                value = defaults[i]
             
             # Format value for display
-            if setting['type'] == 'bool':
+            if setting_type == 'bool':
                 value_str = "On" if value else "Off"
                 value_color = (100, 255, 100) if value else (150, 150, 150)
-            elif setting['type'] == 'datetime':
-                value_str = datetime.now().strftime("%H:%M") if not value else value
+            elif setting_type == 'datetime':
+                value_str = self._get_time_str() if not value else value
                 value_color = (100, 200, 255)
-            elif setting['type'] == 'info':
+            elif setting_type == 'info':
                 value_str = str(value)
                 value_color = (150, 150, 150)
             else:
@@ -311,7 +434,7 @@ class SettingsScene:
             is_selected = i == self.selected_index
             
             # iOS-style cell with separator
-            cell_bg = pygame.Rect(15, y - 3, 450, 50)
+            cell_bg = self._item_rects[i]
             
             # Selected cell: blue highlight
             if is_selected:
@@ -324,15 +447,17 @@ class SettingsScene:
                 label_color = (200, 200, 200)
             
             # Label (left, bold)
-            label_surf = self.font_label.render(setting['label'], True, label_color)
-            label_rect = label_surf.get_rect()
+            label_surf = self._render_cached(self.font_label, labels[i], label_color, self._label_cache)
+            label_rect = self._label_rect
+            label_rect.size = label_surf.get_size()
             label_rect.left = 30
             label_rect.centery = y + 20
             screen.blit(label_surf, label_rect)
             
             # Value (right, colored)
-            value_surf = self.font_value.render(value_str, True, value_color)
-            value_rect = value_surf.get_rect()
+            value_surf = self._render_cached(self.font_value, value_str, value_color, self._value_surf_cache)
+            value_rect = self._value_rect
+            value_rect.size = value_surf.get_size()
             value_rect.right = 440
             value_rect.centery = y + 20
             screen.blit(value_surf, value_rect)
@@ -6,6 +6,7 @@ Tests core functionality without GUI
 
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def test_imports():
@@ -26,10 +27,14 @@ def test_imports():
         'ui.overlay_renderer',
     ]
     
+    # Overlap the per-module filesystem lookups; report in list order
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = {mod: ex.submit(__import__, mod) for mod in modules}
+    
     failed = []
     for mod in modules:
         try:
-            __import__(mod)
+            futures[mod].result()
             print(f"  ✓ {mod}")
         except Exception as e:
             print(f"  ✗ {mod}: {e}")
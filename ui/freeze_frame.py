@@ -2,8 +2,10 @@
 
 import pygame
 import time
-from typing import Optional
-import numpy as np
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class FreezeFrame:
@@ -19,15 +21,19 @@ class FreezeFrame:
             duration_ms: Freeze duration in milliseconds
         """
         self.duration_ms = duration_ms
+        self._duration_ns = duration_ms * 1_000_000
         
         # State
         self.is_active = False
         self.freeze_surface: Optional[pygame.Surface] = None
-        self.freeze_start_time: Optional[float] = None
+        self.freeze_start_ns: Optional[int] = None
+        
+        # Reused scale destination (screen size is fixed)
+        self._scaled_cache: Optional[pygame.Surface] = None
         
         print(f"[FreezeFrame] Initialized ({duration_ms}ms)")
     
-    def trigger(self, frame: np.ndarray, screen_size: tuple) -> None:
+    def trigger(self, frame: 'np.ndarray', screen_size: tuple) -> None:
         """
         Trigger freeze frame with captured image.
         
@@ -37,15 +43,32 @@ class FreezeFrame:
         """
         # Convert numpy array to pygame surface
         try:
-            # Transpose for pygame (width, height) order
-            surf = pygame.surfarray.make_surface(np.swapaxes(frame, 0, 1))
+            import numpy as np
+            
+            # Row-major HxWx3 matches pygame's buffer layout: no transpose needed
+            h, w = frame.shape[:2]
+            buf = frame if frame.flags['C_CONTIGUOUS'] else np.ascontiguousarray(frame)
+            surf = pygame.image.frombuffer(buf.tobytes(), (w, h), 'RGB')
             
-            # Scale to screen size
-            self.freeze_surface = pygame.transform.scale(surf, screen_size)
+            # Match display pixel format so blits during the freeze are plain copies
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            
+            # Scale to screen size (reusing the destination surface between shots)
+            if surf.get_size() == tuple(screen_size):
+                self.freeze_surface = surf
+            else:
+                # transform.scale needs dest in the same pixel format as surf
+                cache = self._scaled_cache
+                if (cache is None or cache.get_size() != tuple(screen_size)
+                        or cache.get_bitsize() != surf.get_bitsize()):
+                    self._scaled_cache = pygame.Surface(screen_size, 0, surf)
+                pygame.transform.scale(surf, screen_size, self._scaled_cache)
+                self.freeze_surface = self._scaled_cache
             
             # Activate freeze
             self.is_active = True
-            self.freeze_start_time = time.time()
+            self.freeze_start_ns = time.monotonic_ns()
             
             print("[FreezeFrame] Activated")
             
@@ -57,6 +80,9 @@ class FreezeFrame:
         """
         Update freeze frame state.
         
+        Callers on a hot path should guard with ``if freeze.is_active:`` so
+        the common inactive case skips the call entirely.
+        
         Returns:
             True if still active
         """
@@ -64,13 +90,11 @@ class FreezeFrame:
             return False
         
         # Check if duration elapsed
-        if self.freeze_start_time is None:
+        if self.freeze_start_ns is None:
             self.is_active = False
             return False
         
-        elapsed_ms = (time.time() - self.freeze_start_time) * 1000
-        
-        if elapsed_ms >= self.duration_ms:
+        if time.monotonic_ns() - self.freeze_start_ns >= self._duration_ns:
             self.is_active = False
             self.freeze_surface = None
             print("[FreezeFrame] Deactivated")
@@ -4,6 +4,20 @@ import pygame
 import math
 
 
+def _tilt_to_offset(tilt: float) -> int:
+    """
+    Map a tilt angle to the spirit level line offset.
+    
+    Args:
+        tilt: Tilt angle in degrees
+    
+    Returns:
+        Offset from center in pixels (clamped to +/-45 deg -> +/-100 px)
+    """
+    t = -45.0 if tilt < -45.0 else (45.0 if tilt > 45.0 else tilt)
+    return int((t / 45.0) * 100.0)
+
+
 class GridOverlay:
     """
     Renders rule-of-thirds grid and spirit level indicator.
@@ -19,13 +33,51 @@ class GridOverlay:
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.enabled = True
         
         # Colors
-        self.grid_color = (255, 255, 255, 80)  # Semi-transparent white
-        self.level_color = (255, 255, 255, 200)
+        self.grid_color = pygame.Color(255, 255, 255, 80)  # Semi-transparent white
+        self.level_color = pygame.Color(255, 255, 255, 200)
+        self.reference_color = pygame.Color(255, 255, 255, 120)
+        
+        # Spirit level: tilt line and fixed reference marker, pre-drawn once
+        level_center_x = screen_width - 20  # Right side
+        self._level_center_y = screen_height // 2
+        self._level_line_x = level_center_x - 30
+        self._level_line_surf = self._build_line_surface(60, 2, self.level_color)
+        self._ref_marker_surf = self._build_line_surface(70, 1, self.reference_color)
+        self._ref_marker_pos = (level_center_x - 35, self._level_center_y - 1)
+        
+        # Rule-of-thirds lines as pre-filled 1px strips (constant for the screen size)
+        x1 = screen_width // 3
+        x2 = 2 * screen_width // 3
+        y1 = screen_height // 3
+        y2 = 2 * screen_height // 3
+        v_line = pygame.Surface((1, screen_height), pygame.SRCALPHA)
+        v_line.fill(self.grid_color)
+        h_line = pygame.Surface((screen_width, 1), pygame.SRCALPHA)
+        h_line.fill(self.grid_color)
+        if pygame.display.get_surface() is not None:
+            v_line = v_line.convert_alpha()
+            h_line = h_line.convert_alpha()
+        self._grid_blits = [
+            (v_line, (x1, 0)),
+            (v_line, (x2, 0)),
+            (h_line, (0, y1)),
+            (h_line, (0, y2)),
+        ]
         
         print("[GridOverlay] Initialized")
     
+    def dirty_rect(self) -> pygame.Rect:
+        """
+        Screen area the grid and level indicator can draw into.
+        
+        Returns:
+            Rect covering the whole screen (grid lines span it)
+        """
+        return pygame.Rect(0, 0, self.screen_width, self.screen_height)
+    
     def render_grid(self, surface: pygame.Surface) -> None:
         """
         Render rule-of-thirds grid.
@@ -33,19 +85,10 @@ class GridOverlay:
         Args:
             surface: Surface to render on
         """
-        # Vertical lines
-        x1 = self.screen_width // 3
-        x2 = 2 * self.screen_width // 3
-        
-        pygame.draw.line(surface, self.grid_color, (x1, 0), (x1, self.screen_height), 1)
-        pygame.draw.line(surface, self.grid_color, (x2, 0), (x2, self.screen_height), 1)
+        if not self.enabled:
+            return
         
-        # Horizontal lines
-        y1 = self.screen_height // 3
-        y2 = 2 * self.screen_height // 3
-        
-        pygame.draw.line(surface, self.grid_color, (0, y1), (self.screen_width, y1), 1)
-        pygame.draw.line(surface, self.grid_color, (0, y2), (self.screen_width, y2), 1)
+        surface.blits(self._grid_blits, doreturn=False)
     
     def render_level(self, surface: pygame.Surface, tilt_angle: float) -> None:
         """
@@ -55,41 +98,43 @@ class GridOverlay:
             surface: Surface to render on
             tilt_angle: Tilt angle in degrees (-90 to +90)
         """
+        if not self.enabled:
+            return
+        
         # Map tilt angle to vertical position
         # -90° (full left) -> bottom
         # 0° (level) -> center
         # +90° (full right) -> top
         
-        # Safe range: -45° to +45°
-        tilt_angle = max(-45, min(45, tilt_angle))
-        
-        # Map to pixel range (100px from center in each direction)
-        max_offset = 100
-        offset = int((tilt_angle / 45.0) * max_offset)
-        
-        # Center position
-        center_y = self.screen_height // 2
-        
-        # Line position
-        line_y = center_y - offset
-        
-        # Draw horizontal line
-        line_length = 60
-        center_x = self.screen_width - 20  # Right side
-        
-        pygame.draw.line(
-            surface,
-            self.level_color,
-            (center_x - line_length // 2, line_y),
-            (center_x + line_length // 2, line_y),
-            2
-        )
-        
-        # Draw reference markers
-        pygame.draw.line(
-            surface,
-            (255, 255, 255, 120),
-            (center_x - line_length // 2 - 5, center_y),
-            (center_x + line_length // 2 + 5, center_y),
-            1
-        )
\ No newline at end of file
+        # Quantize to whole degrees so sensor noise doesn't jitter the line
+        tilt_angle = round(tilt_angle)
+        
+        # Safe range: -45° to +45°, mapped to 100px from center in each direction
+        offset = _tilt_to_offset(tilt_angle)
+        
+        # Level line is identical at every offset; only its position moves
+        surface.blits((
+            (self._level_line_surf, (self._level_line_x, self._level_center_y - offset - 1)),
+            (self._ref_marker_surf, self._ref_marker_pos),
+        ), doreturn=False)
+    
+    def _build_line_surface(self, length: int, width: int, color: pygame.Color) -> pygame.Surface:
+        """
+        Draw one horizontal line onto a small transparent surface.
+        
+        Args:
+            length: Line length in pixels (endpoints inclusive)
+            width: Line width in pixels
+            color: Line color
+        
+        Returns:
+            Surface with the line drawn at y=1
+        """
+        line_surf = pygame.Surface((length + 1, width + 2), pygame.SRCALPHA)
+        pygame.draw.line(line_surf, color, (0, 1), (length, 1), width)
+        
+        # Match the display pixel format so the per-frame blit is a fast path
+        if pygame.display.get_surface() is not None:
+            line_surf = line_surf.convert_alpha()
+        
+        return line_surf
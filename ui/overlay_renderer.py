@@ -1,8 +1,9 @@
 """Overlay renderer for top info bar (battery, time, etc.)."""
 
 import pygame
+from collections import deque
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 
 class OverlayRenderer:
@@ -22,49 +23,151 @@ class OverlayRenderer:
         self.font_regular = font_regular
         self.font_bold = font_bold
         self.screen_width = screen_width
+        self.enabled = True
         
         # Colors
-        self.text_color = (200, 200, 200)
-        self.bg_color = (30, 30, 30, 180)  # Semi-transparent dark
+        self.text_color = pygame.Color(200, 200, 200)
+        self.info_text_color = pygame.Color(180, 180, 180)
+        self.bg_color = pygame.Color(30, 30, 30, 180)  # Semi-transparent dark
+        
+        # Static bar backgrounds (minimal 30px, extended 50px)
+        self._bg_minimal = pygame.Surface((screen_width, 30), pygame.SRCALPHA)
+        self._bg_minimal.fill(self.bg_color)
+        self._bg_extended = pygame.Surface((screen_width, 50), pygame.SRCALPHA)
+        self._bg_extended.fill(self.bg_color)
+        if pygame.display.get_surface() is not None:
+            self._bg_minimal = self._bg_minimal.convert_alpha()
+            self._bg_extended = self._bg_extended.convert_alpha()
+        
+        # Rendered text surfaces keyed by (font id, text, color), FIFO-evicted
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+        self._cache_order: deque = deque()
+        self._max_cached_texts = 64
+        
+        # Last rendered battery/time surfaces, refreshed by prepare()
+        self._last_sec = -1
+        self._time_str: Optional[str] = None
+        self._time_surf: Optional[pygame.Surface] = None
+        self._time_rect: Optional[pygame.Rect] = None
+        self._batt_val: Optional[int] = None
+        self._batt_surf: Optional[pygame.Surface] = None
+        
+        # Extended info row, rebuilt only when its inputs change
+        self._info_key: Optional[tuple] = None
+        self._info_surf: Optional[pygame.Surface] = None
         
         print("[OverlayRenderer] Initialized")
     
-    def render_minimal(self, surface: pygame.Surface, 
-                      battery_percent: Optional[int],
-                      datetime_str: str) -> None:
+    def _render_cached(self, font, text: str, color: pygame.Color) -> pygame.Surface:
+        """Render text once per (font, text, color) and reuse the surface."""
+        # pygame.Color is mutable and unhashable, so key on its RGBA values
+        key = (id(font), text, tuple(color))
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert_alpha()
+            self._text_cache[key] = surf
+            self._cache_order.append(key)
+            if len(self._cache_order) > self._max_cached_texts:
+                del self._text_cache[self._cache_order.popleft()]
+        return surf
+    
+    def dirty_rect(self) -> pygame.Rect:
         """
-        Render minimal info bar (battery + time).
+        Screen area the info bar can draw into (extended bar height).
+        
+        Returns:
+            Rect of the top bar region
+        """
+        return pygame.Rect(0, 0, self.screen_width, 50)
+    
+    def prepare(self, battery_percent: Optional[int], now: float) -> None:
+        """
+        Refresh battery/time surfaces; call once per frame before rendering.
+        
+        The clock is only re-formatted when the wall-clock second changes and
+        the battery only when its value changes, so steady-state frames do
+        no string formatting or font rendering.
         
         Args:
-            surface: Surface to render on
             battery_percent: Battery percentage or None
-            datetime_str: Formatted datetime string
+            now: Current time as a Unix timestamp (time.time())
         """
-        # Background bar
-        bar_height = 30
-        bg_surf = pygame.Surface((self.screen_width, bar_height), pygame.SRCALPHA)
-        bg_surf.fill(self.bg_color)
-        surface.blit(bg_surf, (0, 0))
-        
-        # Battery (left)
+        sec = int(now)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._set_time(datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M"))
+        self._set_battery(battery_percent)
+    
+    def _set_battery(self, battery_percent: Optional[int]) -> None:
+        """Re-render the battery surface if the value changed."""
+        if self._batt_surf is not None and battery_percent == self._batt_val:
+            return
         if battery_percent is not None:
             battery_text = f"{battery_percent}%"
         else:
             battery_text = "—%"
+        self._batt_val = battery_percent
+        self._batt_surf = self._render_cached(self.font_regular, battery_text, self.text_color)
+    
+    def _set_time(self, datetime_str: str) -> None:
+        """Re-render the time surface if the string changed."""
+        if datetime_str == self._time_str:
+            return
+        self._time_str = datetime_str
+        self._time_surf = self._render_cached(self.font_regular, datetime_str, self.text_color)
+        self._time_rect = self._time_surf.get_rect()
+        self._time_rect.right = self.screen_width - 10
+        self._time_rect.top = 5
+    
+    def _render_top_row(self, surface: pygame.Surface,
+                        battery_percent: Optional[int],
+                        datetime_str: Optional[str],
+                        bg: pygame.Surface) -> None:
+        """
+        Blit bar background, battery (left) and time (right).
+        
+        Args:
+            surface: Surface to render on
+            battery_percent: Battery percentage or None
+            datetime_str: Formatted datetime, or None to keep the prepared one
+            bg: Pre-filled background surface for the bar
+        """
+        if datetime_str is not None:
+            self._set_battery(battery_percent)
+            self._set_time(datetime_str)
+        
+        surface.blit(bg, (0, 0))
         
-        battery_surf = self.font_regular.render(battery_text, True, self.text_color)
-        surface.blit(battery_surf, (10, 5))
+        if self._batt_surf is not None:
+            surface.blit(self._batt_surf, (10, 5))
         
-        # Time (right)
-        time_surf = self.font_regular.render(datetime_str, True, self.text_color)
-        time_rect = time_surf.get_rect()
-        time_rect.right = self.screen_width - 10
-        time_rect.top = 5
-        surface.blit(time_surf, time_rect)
+        if self._time_surf is not None:
+            surface.blit(self._time_surf, self._time_rect)
+    
+    def render_minimal(self, surface: pygame.Surface, 
+                      battery_percent: Optional[int] = None,
+                      datetime_str: Optional[str] = None) -> None:
+        """
+        Render minimal info bar (battery + time).
+        
+        If datetime_str is given, battery and time are taken from the
+        arguments; otherwise the surfaces from the last prepare() are used.
+        
+        Args:
+            surface: Surface to render on
+            battery_percent: Battery percentage or None
+            datetime_str: Formatted datetime string
+        """
+        if not self.enabled:
+            return
+        
+        self._render_top_row(surface, battery_percent, datetime_str, self._bg_minimal)
     
     def render_extended(self, surface: pygame.Surface,
                        battery_percent: Optional[int],
-                       datetime_str: str,
+                       datetime_str: Optional[str],
                        lux: Optional[float],
                        zoom: float,
                        filter_name: str,
@@ -72,6 +175,8 @@ class OverlayRenderer:
         """
         Render extended info bar with additional data.
         
+        Pass datetime_str=None to use the surfaces from the last prepare().
+        
         Args:
             surface: Surface to render on
             battery_percent: Battery percentage
@@ -81,40 +186,28 @@ class OverlayRenderer:
             filter_name: Active filter name
             photo_count: Number of photos stored
         """
-        # Background bar (taller)
-        bar_height = 50
-        bg_surf = pygame.Surface((self.screen_width, bar_height), pygame.SRCALPHA)
-        bg_surf.fill(self.bg_color)
-        surface.blit(bg_surf, (0, 0))
-        
-        # Row 1: Battery + Time
-        if battery_percent is not None:
-            battery_text = f"{battery_percent}%"
-        else:
-            battery_text = "—%"
-        
-        battery_surf = self.font_regular.render(battery_text, True, self.text_color)
-        surface.blit(battery_surf, (10, 5))
-        
-        time_surf = self.font_regular.render(datetime_str, True, self.text_color)
-        time_rect = time_surf.get_rect()
-        time_rect.right = self.screen_width - 10
-        time_rect.top = 5
-        surface.blit(time_surf, time_rect)
-        
-        # Row 2: Extended info
-        info_parts = []
-        
-        if lux is not None:
-            info_parts.append(f"Lux:{int(lux)}")
-        
-        info_parts.append(f"Zoom:{zoom:.1f}x")
-        
-        if filter_name != "none":
-            info_parts.append(f"Filter:{filter_name}")
-        
-        info_parts.append(f"Photos:{photo_count}")
-        
-        info_text = " | ".join(info_parts)
-        info_surf = self.font_regular.render(info_text, True, (180, 180, 180))
-        surface.blit(info_surf, (10, 28))
\ No newline at end of file
+        if not self.enabled:
+            return
+        
+        # Background bar (taller) + Row 1: Battery + Time
+        self._render_top_row(surface, battery_percent, datetime_str, self._bg_extended)
+        
+        # Row 2: Extended info (string + surface only rebuilt on change)
+        key = (None if lux is None else int(lux), round(zoom, 1), filter_name, photo_count)
+        if key != self._info_key or self._info_surf is None:
+            info_parts = []
+            
+            if lux is not None:
+                info_parts.append(f"Lux:{int(lux)}")
+            
+            info_parts.append(f"Zoom:{zoom:.1f}x")
+            
+            if filter_name != "none":
+                info_parts.append(f"Filter:{filter_name}")
+            
+            info_parts.append(f"Photos:{photo_count}")
+            
+            info_text = " | ".join(info_parts)
+            self._info_surf = self._render_cached(self.font_regular, info_text, self.info_text_color)
+            self._info_key = key
+        surface.blit(self._info_surf, (10, 28))
\ No newline at end of file